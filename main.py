@@ -1,11 +1,20 @@
 import sys
 import os
+import re
+import time
+import threading
 import traceback
+import atexit
+import queue
 import logging
+import logging.handlers
+import functools
 import webbrowser
-from typing import Dict, Optional, Union, List
+from typing import Dict, Optional, Union, List, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import OrderedDict
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 
 try:
     import orjson as json
@@ -14,18 +23,32 @@ except ImportError:
     import json
     USE_ORJSON = False
 
+# orjson 与标准库 json 的 loads 都直接接受 bytes，统一绑定后调用处无需再分支
+_loads = json.loads
+
+def _dumps(obj) -> bytes:
+    if USE_ORJSON:
+        return json.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QGroupBox, QHeaderView,
-    QTreeWidget, QTreeWidgetItem, QLineEdit, QComboBox, QMessageBox
+    QTableWidgetItem, QLabel, QGroupBox, QHeaderView,
+    QTreeView, QLineEdit, QComboBox, QMessageBox, QStyledItemDelegate,
+    QStyleOptionButton, QStyle
+)
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QTimer, QDeadlineTimer, QAbstractItemModel, QAbstractTableModel, QModelIndex,
+    QItemSelectionModel, QEvent, QRect, QSize, QThreadPool
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
 from PySide6.QtGui import QFont, QColor
 from qfluentwidgets import (
     FluentWindow, NavigationItemPosition, FluentIcon, setTheme, Theme,
     InfoBar, InfoBarPosition, ListWidget, ProgressRing, BodyLabel,
-    PushButton, PrimaryPushButton
+    PushButton
 )
 
 API_BASE = "https://autopatch.hk4e.com/pkg_version"
@@ -38,6 +61,10 @@ GAME_CONFIG = {
     "bh3": {"name": "崩坏3", "short_name": "崩坏3", "voice": []},
 }
 
+# 回调中频繁用到的游戏名称和语音包列表，预先展开为单层字典
+GAME_NAMES = {game: config['name'] for game, config in GAME_CONFIG.items()}
+GAME_VOICES = {game: config['voice'] for game, config in GAME_CONFIG.items()}
+
 VOICEPACK_LIST = {
     "汉语": "Audio_Chinese_pkg_version",
     "英语": "Audio_English(US)_pkg_version",
@@ -47,6 +74,22 @@ VOICEPACK_LIST = {
 
 DEFAULT_GAME = "hk4e"
 
+# 文件浏览器最多缓存的文件树数量
+FILE_CACHE_SIZE = 3
+
+# 退出时等待所有后台线程结束的总时限（毫秒）
+SHUTDOWN_TIMEOUT_MS = 1500
+
+# 预加载版本列表、加载文件列表时同时进行的请求数上限
+PRELOAD_MAX_WORKERS = 4
+FILE_LIST_MAX_WORKERS = 5
+
+# 版本列表磁盘缓存的位置
+CACHE_DIR = os.getenv('HOYO_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'hoyofiles')
+
+# pkg_version 每行一个 JSON 对象，行间空白（含 \r 与空行）统一替换为逗号
+_NDJSON_SEPARATOR = re.compile(rb'\s*\n\s*')
+
 class LogLevel(Enum):
     DEBUG = logging.DEBUG
     INFO = logging.INFO
@@ -56,11 +99,23 @@ class LogLevel(Enum):
 
 LOG_LEVEL = os.getenv('HOYO_LOG_LEVEL', 'ERROR').upper()
 
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL, logging.ERROR),
-    format='[%(levelname)s] %(message)s',
-    datefmt='%H:%M:%S'
-)
+def setup_logging() -> logging.handlers.QueueListener:
+    """GUI 线程只把日志记录放入队列，格式化和输出由后台线程完成"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s', datefmt='%H:%M:%S'))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, LOG_LEVEL, logging.ERROR))
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    # 退出时先输出队列中剩余的日志
+    atexit.register(listener.stop)
+    return listener
+
+_log_listener = setup_logging()
 
 logger = logging.getLogger('HoyoFiles')
 
@@ -83,26 +138,47 @@ def perf(msg: str):
     if LOG_LEVEL in ['DEBUG', 'INFO']:
         print(f"[PERF] {msg}")
 
+def env_int(name: str, default: int) -> int:
+    """读取整数环境变量，格式错误时记录警告并使用默认值"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        warning(f"环境变量 {name}={value!r} 不是有效的整数，使用默认值 {default}")
+        return default
+
+# 版本列表磁盘缓存的有效期（秒），过期后向服务器重新验证
+VERSION_CACHE_TTL = env_int('HOYO_CACHE_TTL', 3600)
+
 class NodeType(Enum):
     FILE = "file"
     DIRECTORY = "dir"
 
-@dataclass
+@dataclass(slots=True)
 class PkgVersionFile:
     remoteName: str
     md5: str
     fileSize: int
     hash: Optional[str] = None
 
-@dataclass
+# 文件节点没有子节点，共享同一个空元组，不必为每个文件分配一个空列表
+_NO_CHILDREN = ()
+
+@dataclass(slots=True)
 class FileNode:
     type: NodeType
     name: str
     size: int
-    children: List['FileNode'] = field(default_factory=list)
+    children: Union[List['FileNode'], tuple] = field(default_factory=list)
     fileData: Optional[PkgVersionFile] = None
+    # 父节点引用，供树模型计算 parent 索引
+    parent: Optional['FileNode'] = field(default=None, repr=False, compare=False)
+    # 目录在父节点 children 中的行号，排序后写入，供树模型直接返回 parent 索引
+    row: int = field(default=0, repr=False, compare=False)
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     name: str
     url: str
@@ -110,27 +186,27 @@ class FileInfo:
     size: int
     type: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ChunkInfo:
     branch: str
     package_id: str
     password: str
     tag: str
 
-@dataclass
+@dataclass(slots=True)
 class ChunkManifest:
     category_id: str
     category_name: str
     manifest: Dict
     stats: Dict
 
-@dataclass
+@dataclass(slots=True)
 class ChunkData:
     build_id: str
     tag: str
     manifests: List[ChunkManifest]
 
-@dataclass
+@dataclass(slots=True)
 class VersionData:
     game: Dict
     voice: Dict
@@ -141,6 +217,10 @@ class VersionData:
 def format_bytes(size: Union[int, str]) -> str:
     if isinstance(size, str):
         size = int(size)
+    return _format_bytes_int(size)
+
+@functools.lru_cache(maxsize=4096)
+def _format_bytes_int(size: int) -> str:
     if size < 0:
         return "未知"
 
@@ -152,6 +232,39 @@ def format_bytes(size: Union[int, str]) -> str:
         i += 1
     return f"{size_float:.2f} {units[i]}"
 
+def ndjson_to_array(payload: bytes) -> bytes:
+    """将 NDJSON 改写为 JSON 数组，整段数据只需一次 loads 调用即可在 C 层完成解析"""
+    body = payload.strip()
+    if not body:
+        return b'[]'
+    return b'[' + _NDJSON_SEPARATOR.sub(b',', body) + b']'
+
+def submit_daemon(limiter: threading.Semaphore, fn, *args) -> Future:
+    """在守护线程中执行 fn，由 limiter 限制同时运行的数量；
+    程序退出时不会等待仍未返回的网络请求"""
+    future = Future()
+
+    def run():
+        with limiter:
+            # 排队期间已被取消的任务直接跳过
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+def iter_completed(futures, is_cancelled, poll_interval: float = 0.1) -> Iterator[Future]:
+    """按完成顺序产出 future，每隔 poll_interval 秒检查一次 is_cancelled()，
+    取消后立即返回，不必等正在进行的请求结束"""
+    pending = set(futures)
+    while pending and not is_cancelled():
+        done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+        yield from done
+
 def copy_to_clipboard(text: str):
     clipboard = QApplication.clipboard()
     clipboard.setText(text)
@@ -169,28 +282,141 @@ def show_message(parent, title: str, message: str, msg_type: str = "info"):
     elif msg_type == "success":
         QMessageBox.information(parent, "成功", message)
 
+class CacheStore:
+    """版本列表的磁盘缓存，每个游戏一个文件，保存 {"data": ..., "etag": ..., "fetched_at": ...}"""
+
+    def __init__(self, directory: Optional[str] = None, ttl: int = VERSION_CACHE_TTL):
+        self.directory = directory or os.path.join(CACHE_DIR, 'versions')
+        self.ttl = ttl
+        self._entries: Dict[str, dict] = {}
+        # 自上次保存后有变化的游戏，保存时只重写这些文件
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def _path(self, game: str) -> str:
+        return os.path.join(self.directory, f"{game}.json")
+
+    def load(self):
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            warning(f"读取版本缓存失败: {str(e)}")
+            return
+
+        entries = {}
+        for name in names:
+            game, ext = os.path.splitext(name)
+            if ext != '.json':
+                continue
+            try:
+                with open(os.path.join(self.directory, name), 'rb') as f:
+                    entry = _loads(f.read())
+            except (OSError, ValueError) as e:
+                warning(f"读取版本缓存失败: {name}: {str(e)}")
+                continue
+            # 字段类型不对的条目直接丢弃，重新请求即可，不能影响程序启动
+            if (not isinstance(entry, dict)
+                    or not isinstance(entry.get('data'), dict)
+                    or not isinstance(entry.get('fetched_at'), (int, float))
+                    or not isinstance(entry.get('etag'), (str, type(None)))):
+                warning(f"忽略格式无效的版本缓存: {name}")
+                continue
+            entries[game] = entry
+
+        with self._lock:
+            self._entries = entries
+        debug(f"已读取版本缓存: {self.directory}, 共 {len(entries)} 个游戏")
+
+    def get(self, game: str) -> Optional[dict]:
+        with self._lock:
+            return self._entries.get(game)
+
+    def put(self, game: str, data: Dict, etag: Optional[str] = None):
+        with self._lock:
+            self._entries[game] = {'data': data, 'etag': etag, 'fetched_at': time.time()}
+            self._dirty.add(game)
+
+    def fresh_data(self) -> Dict[str, Dict]:
+        """返回仍在有效期内、无需向服务器验证的版本列表"""
+        now = time.time()
+        with self._lock:
+            return {
+                game: entry['data']
+                for game, entry in self._entries.items()
+                if now - entry.get('fetched_at', 0) < self.ttl
+            }
+
+    def save(self):
+        """只重写有变化的游戏；写入临时文件后原子替换，避免写入中途退出损坏缓存"""
+        # 持有写锁期间取快照，多次保存按顺序落盘，旧快照不会覆盖新内容
+        with self._write_lock:
+            with self._lock:
+                pending = {game: _dumps(self._entries[game]) for game in self._dirty}
+                self._dirty.clear()
+            if not pending:
+                return
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                for game, payload in pending.items():
+                    path = self._path(game)
+                    tmp_path = f"{path}.tmp"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(payload)
+                    os.replace(tmp_path, path)
+            except OSError as e:
+                warning(f"写入版本缓存失败: {str(e)}")
+
 class APIClient:
 
-    def __init__(self):
+    def __init__(self, cache_store: Optional[CacheStore] = None):
         self.api_base = API_BASE
         self.use_fallback = False
+        self.cache_store = cache_store
+
+        # 复用同一个 Session，避免每次请求都重新建立 TCP/TLS 连接。
+        # 所有请求都发往同一个源，连接池容量按同时进行的最大请求数设置
+        # （预加载、文件列表和当前游戏的版本列表），超出的连接不会被用完即弃
+        self._session = requests.Session()
+        self._session.headers.update({'Accept-Encoding': 'gzip'})
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=PRELOAD_MAX_WORKERS + FILE_LIST_MAX_WORKERS + 1,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
 
     def _get_url(self, path: str) -> str:
         return f"{self.api_base}/{path}"
 
+    def warm(self):
+        """提前与服务器建立连接，之后的第一个请求可直接复用，失败时忽略"""
+        try:
+            self._session.head(f"{self.api_base}/", timeout=2)
+        except requests.RequestException as e:
+            debug(f"预热连接失败: {str(e)}")
+
     def fetch_version_list(self, game: str) -> Dict:
         url = self._get_url(f"{game}_versions.json")
         debug(f"请求版本列表: {url}")
+
+        # 有磁盘缓存时带上 ETag，服务器返回 304 即可直接复用缓存内容
+        cached = self.cache_store.get(game) if self.cache_store else None
+        headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10, headers=headers)
             debug(f"响应状态码: {response.status_code}")
+            if response.status_code == 304 and cached:
+                debug("版本列表未变化，使用磁盘缓存")
+                self.cache_store.put(game, cached['data'], cached['etag'])
+                return cached['data']
             response.raise_for_status()
 
-            if USE_ORJSON:
-                data = json.loads(response.content)
-            else:
-                data = response.json()
-
+            data = _loads(response.content)
+            if self.cache_store:
+                self.cache_store.put(game, data, response.headers.get('ETag'))
             debug(f"成功获取版本列表，共 {len(data)} 个版本")
             return data
         except Exception as e:
@@ -205,19 +431,41 @@ class APIClient:
     def fetch_pkg_version(self, game: str, version: str, filename: str) -> str:
         url = self._get_url(f"{game}/{version}/{filename}")
         debug(f"请求文件: {url}")
-        response = requests.get(url, timeout=30)
+        response = self._session.get(url, timeout=30)
         debug(f"响应状态码: {response.status_code}")
         response.raise_for_status()
         debug(f"成功获取文件，大小: {len(response.text)} 字节")
         return response.text
 
+    def iter_pkg_version(self, game: str, version: str, filename: str,
+                         chunk_size: int = 65536) -> Iterator[bytes]:
+        """流式下载 pkg_version，每收到一批完整的行就改写为 JSON 数组产出，
+        调用方可以边下载边解析"""
+        url = self._get_url(f"{game}/{version}/{filename}")
+        debug(f"流式请求文件: {url}")
+        with self._session.get(url, stream=True, timeout=30) as response:
+            debug(f"响应状态码: {response.status_code}")
+            response.raise_for_status()
+
+            pending = b''
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                pending += chunk
+                cut = pending.rfind(b'\n')
+                if cut < 0:
+                    continue
+                yield ndjson_to_array(pending[:cut])
+                pending = pending[cut + 1:]
+
+            if pending.strip():
+                yield ndjson_to_array(pending)
+
     def fetch_chunk_data(self, game: str, version: str) -> Dict:
         url = self._get_url(f"chunk/{game}_{version}.json")
         debug(f"请求 chunk 数据: {url}")
-        response = requests.get(url, timeout=10)
+        response = self._session.get(url, timeout=10)
         debug(f"响应状态码: {response.status_code}")
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         debug("成功获取 chunk 数据")
         return data
 
@@ -329,7 +577,94 @@ class VersionList(QWidget):
         if version:
             self.version_selected.emit(version)
 
+class ButtonDelegate(QStyledItemDelegate):
+    """在单元格内直接绘制一组按钮，不为每一行创建控件；
+    点击时发出 button_clicked(按钮键, 单元格 UserRole 数据)"""
+    button_clicked = Signal(str, object)
+
+    BUTTON_WIDTH = 56
+    BUTTON_HEIGHT = 26
+    BUTTON_SPACING = 4
+    MARGIN = 2
+
+    def __init__(self, buttons: list, parent=None):
+        super().__init__(parent)
+        self._buttons = buttons
+        # 所有单元格共用同一个按钮样式选项，绘制时只更新位置和文字
+        self._button_option = QStyleOptionButton()
+        self._button_option.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+
+    def buttons_for(self, index: QModelIndex) -> list:
+        """返回单元格中要显示的 (按钮键, 文本) 列表，没有数据的单元格不显示按钮"""
+        return self._buttons if index.data(Qt.ItemDataRole.UserRole) else []
+
+    def _button_rects(self, rect: QRect, count: int) -> list:
+        height = min(self.BUTTON_HEIGHT, rect.height() - 2 * self.MARGIN)
+        top = rect.top() + (rect.height() - height) // 2
+        left = rect.left() + self.MARGIN
+        step = self.BUTTON_WIDTH + self.BUTTON_SPACING
+        return [QRect(left + i * step, top, self.BUTTON_WIDTH, height) for i in range(count)]
+
+    def paint(self, painter, option, index: QModelIndex):
+        super().paint(painter, option, index)
+
+        buttons = self.buttons_for(index)
+        if not buttons:
+            return
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        button = self._button_option
+        button.fontMetrics = option.fontMetrics
+        for (_, text), rect in zip(buttons, self._button_rects(option.rect, len(buttons))):
+            button.rect = rect
+            button.text = text
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        # 没有按钮的单元格也保留按钮高度，统一行高时以首行为准也不会把按钮压扁
+        hint = super().sizeHint(option, index)
+        height = max(hint.height(), self.BUTTON_HEIGHT + 2 * self.MARGIN)
+        count = len(self.buttons_for(index))
+        if not count:
+            return QSize(hint.width(), height)
+        width = count * self.BUTTON_WIDTH + (count - 1) * self.BUTTON_SPACING + 2 * self.MARGIN
+        return QSize(width, height)
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            buttons = self.buttons_for(index)
+            pos = event.position().toPoint()
+            for (key, _), rect in zip(buttons, self._button_rects(option.rect, len(buttons))):
+                if rect.contains(pos):
+                    self.button_clicked.emit(key, index.data(Qt.ItemDataRole.UserRole))
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+class FileActionDelegate(ButtonDelegate):
+    """文件树操作列：根据下载地址以及文件的 MD5 / Hash 是否存在显示对应按钮"""
+
+    def __init__(self, parent=None):
+        super().__init__([], parent)
+        self.download_enabled = False
+
+    def buttons_for(self, index: QModelIndex) -> list:
+        file_data = index.data(Qt.ItemDataRole.UserRole)
+        if not file_data:
+            return []
+        buttons = []
+        if self.download_enabled:
+            buttons.append(("download", "下载"))
+        if file_data.md5:
+            buttons.append(("md5", "MD5"))
+        if file_data.hash:
+            buttons.append(("hash", "Hash"))
+        return buttons
+
 class PackageTab(QWidget):
+    # 空状态提示的字体和颜色，首次使用时创建后在所有表格间共享
+    _EMPTY_FONT: Optional[QFont] = None
+    _EMPTY_FG: Optional[QColor] = None
 
     def __init__(self, api_client: APIClient):
         super().__init__()
@@ -388,43 +723,52 @@ class PackageTab(QWidget):
         table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
 
+        # 操作列的按钮由委托绘制，链接保存在该列单元格的 UserRole 中
+        delegate = ButtonDelegate([("copy", "复制"), ("download", "下载")], table)
+        delegate.button_clicked.connect(self.on_package_action)
+        table.setItemDelegateForColumn(4, delegate)
+
         return table
 
     def _set_table_empty(self, table: QTableWidget, message: str):
         """设置表格为空状态，显示提示信息"""
-        for row in range(table.rowCount()):
-            widget = table.cellWidget(row, 4)
-            if widget:
-                table.removeCellWidget(row, 4)
-                widget.deleteLater()
         table.clearContents()
         table.clearSpans()
         table.setRowCount(1)
         table.setSpan(0, 0, 1, 5)
         item = QTableWidgetItem(message)
         item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        item.setFont(QFont("", 10))
-        item.setForeground(QColor(128, 128, 128))
+        font, color = self._empty_style()
+        item.setFont(font)
+        item.setForeground(color)
         table.setItem(0, 0, item)
 
+    @classmethod
+    def _empty_style(cls):
+        """QFont 需要在 QApplication 创建之后才能构造，因此延迟到首次使用时初始化"""
+        if cls._EMPTY_FONT is None:
+            cls._EMPTY_FONT = QFont("", 10)
+            cls._EMPTY_FG = QColor(128, 128, 128)
+        return cls._EMPTY_FONT, cls._EMPTY_FG
+
     def _extract_packages(self, data: dict, pkg_type: str) -> list:
-        """从数据中提取包列表"""
+        """从数据中提取 (包, 类型) 列表，直接引用原始字典而不复制"""
         packages = []
         if data.get('game'):
-            packages.append({**data['game'], 'type': pkg_type})
+            packages.append((data['game'], pkg_type))
         for voice_pkg in data.get('voice', {}).values():
-            packages.append({**voice_pkg, 'type': '语音包'})
+            packages.append((voice_pkg, '语音包'))
         return packages
 
     def load_data(self, version_data: dict):
         # 游戏包
         self.game_packages = []
         if version_data.get('game', {}).get('full'):
-            self.game_packages.append({**version_data['game']['full'], 'type': '游戏本体'})
+            self.game_packages.append((version_data['game']['full'], '游戏本体'))
         for segment in version_data.get('game', {}).get('segments', []):
-            self.game_packages.append({**segment, 'type': '游戏本体(分卷)'})
+            self.game_packages.append((segment, '游戏本体(分卷)'))
         for voice_pkg in version_data.get('voice', {}).values():
-            self.game_packages.append({**voice_pkg, 'type': '语音包'})
+            self.game_packages.append((voice_pkg, '语音包'))
 
         if self.game_packages:
             self.game_table.clearSpans()
@@ -436,13 +780,13 @@ class PackageTab(QWidget):
 
         # 更新包
         self.update_packages = {
-            ver: self._extract_packages({'game': data.get('game'), 'voice': data.get('voice', {})}, '游戏本体')
+            ver: self._extract_packages(data, '游戏本体')
             for ver, data in version_data.get('update', {}).items()
         }
         all_updates = [
-            {**pkg, 'version': ver}
+            (pkg, pkg_type, ver)
             for ver, packages in self.update_packages.items()
-            for pkg in packages
+            for pkg, pkg_type in packages
         ]
 
         if all_updates:
@@ -454,34 +798,36 @@ class PackageTab(QWidget):
             self.update_copy_all_btn.setEnabled(False)
 
     def populate_table(self, table: QTableWidget, packages: list, show_version: bool = False):
+        """packages 中每项为 (包, 类型)；show_version 时为 (包, 类型, 版本)"""
         if not packages:
             return
 
-        table.clearContents()
-        table.clearSpans()
-        table.setRowCount(len(packages))
-
-        for row, pkg in enumerate(packages):
-            name = f"[{pkg.get('version', '')}] {pkg.get('name', '')}" if show_version else pkg.get('name', '')
-            table.setItem(row, 0, QTableWidgetItem(name))
-            table.setItem(row, 1, QTableWidgetItem(pkg.get('type', '')))
-            table.setItem(row, 2, QTableWidgetItem(format_bytes(pkg.get('size', 0))))
-            table.setItem(row, 3, QTableWidgetItem(pkg.get('checksum', '')))
-
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(2, 2, 2, 2)
-
-            url = pkg.get('url', '')
-            copy_btn = PushButton("复制")
-            copy_btn.clicked.connect(lambda checked, u=url: self.copy_url(u))
-            btn_layout.addWidget(copy_btn)
-
-            download_btn = PrimaryPushButton("下载")
-            download_btn.clicked.connect(lambda checked, u=url: open_link(u))
-            btn_layout.addWidget(download_btn)
+        # 逐格 setItem 会反复触发布局和重绘，整批填充完成后只重绘一次
+        table.setUpdatesEnabled(False)
+        try:
+            table.clearContents()
+            table.clearSpans()
+            table.setRowCount(len(packages))
+
+            for row, entry in enumerate(packages):
+                pkg, pkg_type = entry[0], entry[1]
+                name = f"[{entry[2]}] {pkg.get('name', '')}" if show_version else pkg.get('name', '')
+                table.setItem(row, 0, QTableWidgetItem(name))
+                table.setItem(row, 1, QTableWidgetItem(pkg_type))
+                table.setItem(row, 2, QTableWidgetItem(format_bytes(pkg.get('size', 0))))
+                table.setItem(row, 3, QTableWidgetItem(pkg.get('checksum', '')))
+
+                action_item = QTableWidgetItem()
+                action_item.setData(Qt.ItemDataRole.UserRole, pkg.get('url', ''))
+                table.setItem(row, 4, action_item)
+        finally:
+            table.setUpdatesEnabled(True)
 
-            table.setCellWidget(row, 4, btn_widget)
+    def on_package_action(self, action: str, url: str):
+        if action == "copy":
+            self.copy_url(url)
+        elif action == "download":
+            open_link(url)
 
     def copy_url(self, url: str):
         copy_to_clipboard(url)
@@ -496,10 +842,13 @@ class PackageTab(QWidget):
         show_message(self, "成功", f"已复制 {len(urls)} 个链接", "success")
 
     def copy_game_packages(self):
-        self._copy_urls([pkg.get('url', '') for pkg in self.game_packages])
+        self._copy_urls([pkg.get('url', '') for pkg, _ in self.game_packages])
 
     def copy_update_packages(self):
-        self._copy_urls([pkg.get('url', '') for pkgs in self.update_packages.values() for pkg in pkgs])
+        self._copy_urls([pkg.get('url', '') for pkgs in self.update_packages.values() for pkg, _ in pkgs])
+
+def _tree_sort_key(node: FileNode):
+    return (node.type is not NodeType.DIRECTORY, node.name)
 
 class LoadFileListWorker(QThread):
     finished = Signal(object)
@@ -515,56 +864,62 @@ class LoadFileListWorker(QThread):
         self.voice_packs = voice_packs
         self.decompressed_path = decompressed_path
         self._is_cancelled = False
+        # 游戏本体文件列表加载失败后置位，其余仍在下载的语音包随即停止
+        self._is_aborted = False
 
     def cancel(self):
         self._is_cancelled = True
 
     def run(self):
         try:
-            import time
             start_time = time.time()
 
             if self._is_cancelled:
                 return
 
-            self.progress.emit("正在加载游戏文件列表...")
-
-            game_data = self.api_client.fetch_pkg_version(
-                self.game, self.version, 'pkg_version'
-            )
-
-            if self._is_cancelled:
-                return
+            pkg_files = [('game', 'pkg_version')] + [
+                (voice, VOICEPACK_LIST[voice])
+                for voice in self.voice_packs if voice in VOICEPACK_LIST
+            ]
 
-            if USE_ORJSON:
-                file_data = [json.loads(line) for line in game_data.split('\n') if line.strip()]
+            if len(pkg_files) > 1:
+                voices = ', '.join(label for label, _ in pkg_files[1:])
+                self.progress.emit(f"正在加载游戏文件列表及语音包: {voices}...")
             else:
-                import json as json_lib
-                file_data = [json_lib.loads(line) for line in game_data.split('\n') if line.strip()]
-
-            for voice in self.voice_packs:
-                if self._is_cancelled:
-                    return
-
-                if voice in VOICEPACK_LIST:
-                    self.progress.emit(f"正在加载语音包: {voice}...")
+                self.progress.emit("正在加载游戏文件列表...")
+
+            # 各文件列表相互独立，并发请求后总耗时约等于最慢的一次请求
+            loaded = {}
+            limiter = threading.Semaphore(FILE_LIST_MAX_WORKERS)
+            futures = {
+                submit_daemon(limiter, self._load_pkg_files, filename): label
+                for label, filename in pkg_files
+            }
+            try:
+                for future in iter_completed(futures, lambda: self._is_cancelled):
+                    if self._is_cancelled:
+                        return
+
+                    label = futures[future]
                     try:
-                        voice_data = self.api_client.fetch_pkg_version(
-                            self.game, self.version, VOICEPACK_LIST[voice]
-                        )
-                        if USE_ORJSON:
-                            voice_files = [json.loads(line) for line in voice_data.split('\n') if line.strip()]
-                        else:
-                            import json as json_lib
-                            voice_files = [json_lib.loads(line) for line in voice_data.split('\n') if line.strip()]
-                        file_data.extend(voice_files)
+                        loaded[label] = future.result()
                     except Exception as e:
+                        if label == 'game':
+                            self._is_aborted = True
+                            raise
                         if not self._is_cancelled:
-                            self.error.emit(f"语音包 [{voice}] 加载失败: {str(e)}")
+                            self.error.emit(f"语音包 [{label}] 加载失败: {str(e)}")
+            finally:
+                for future in futures:
+                    future.cancel()
 
             if self._is_cancelled:
                 return
 
+            file_data = []
+            for label, _ in pkg_files:
+                file_data.extend(loaded.get(label, ()))
+
             self.progress.emit("正在构建文件树...")
 
             root = FileNode(
@@ -574,44 +929,55 @@ class LoadFileListWorker(QThread):
                 children=[]
             )
 
-            dir_cache = {'': root}
+            # 以 (父目录, 名称) 为键，不必为每一层拼接完整路径字符串；
+            # 构建期间所有节点都存活，id() 不会被复用
+            dir_cache = {}
+            # 热循环中避免重复的枚举属性查找
+            _DIR = NodeType.DIRECTORY
+            _FILE = NodeType.FILE
 
             for file in file_data:
+                # 文件数可达十万级，构建期间也要能及时响应取消
+                if self._is_cancelled:
+                    return
                 path_parts = file['remoteName'].replace('\\', '/').split('/')
                 file_size = file['fileSize']
 
-                current_path = ''
-                for i, part in enumerate(path_parts[:-1]):
-                    parent_path = current_path
-                    current_path = f"{current_path}/{part}" if current_path else part
-
-                    if current_path not in dir_cache:
-                        new_dir = FileNode(
-                            type=NodeType.DIRECTORY,
-                            name=part,
+                parent_node = root
+                for part in path_parts[:-1]:
+                    node = dir_cache.get((id(parent_node), part))
+                    if node is None:
+                        # 同名目录在不同层级大量重复出现，只在创建节点时驻留，
+                        # 已存在的目录无需每次查找驻留表
+                        name = sys.intern(part)
+                        node = FileNode(
+                            type=_DIR,
+                            name=name,
                             size=0,
-                            children=[]
+                            children=[],
+                            parent=parent_node
                         )
-                        dir_cache[parent_path].children.append(new_dir)
-                        dir_cache[current_path] = new_dir
+                        parent_node.children.append(node)
+                        dir_cache[(id(parent_node), name)] = node
 
-                    dir_cache[current_path].size += file_size
+                    parent_node = node
 
-                parent_path = '/'.join(path_parts[:-1])
-                parent_node = dir_cache.get(parent_path, root)
                 parent_node.children.append(FileNode(
-                    type=NodeType.FILE,
+                    type=_FILE,
                     name=path_parts[-1],
                     size=file_size,
-                    children=[],
+                    children=_NO_CHILDREN,
                     fileData=PkgVersionFile(
                         remoteName=file['remoteName'],
                         md5=file['md5'],
                         fileSize=file_size,
                         hash=file.get('hash')
-                    )
+                    ),
+                    parent=parent_node
                 ))
 
+            if self._is_cancelled:
+                return
             self.sort_tree(root)
 
             elapsed = time.time() - start_time
@@ -627,11 +993,158 @@ class LoadFileListWorker(QThread):
             if not self._is_cancelled:
                 self.error.emit(str(e))
 
+    def _load_pkg_files(self, filename: str) -> list:
+        """边下载边解析：每收到一批完整的行就立即解析，解析时间与传输时间重叠"""
+        file_data = []
+        for payload in self.api_client.iter_pkg_version(self.game, self.version, filename):
+            if self._is_cancelled or self._is_aborted:
+                break
+            file_data.extend(_loads(payload))
+        return file_data
+
     def sort_tree(self, node: FileNode):
-        node.children.sort(key=lambda x: (x.type != NodeType.DIRECTORY, x.name))
-        for child in node.children:
-            if child.type == NodeType.DIRECTORY:
-                self.sort_tree(child)
+        """目录在前、按名称排序，记录目录的行号，并在后序回溯时汇总目录大小；
+        使用显式栈遍历，避免深层目录触发递归开销"""
+        _DIR = NodeType.DIRECTORY
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if visited:
+                current.size = sum(child.size for child in current.children)
+                continue
+            current.children.sort(key=_tree_sort_key)
+            stack.append((current, True))
+            # 排序后目录都在文件之前，遇到第一个文件即可停止
+            for row, child in enumerate(current.children):
+                if child.type is not _DIR:
+                    break
+                child.row = row
+                stack.append((child, False))
+
+FILE_TREE_HEADERS = ["名称", "大小", "操作"]
+
+class FileNodeModel(QAbstractItemModel):
+    """直接包装 FileNode 树，视图只为可见行请求数据，无需逐项创建控件"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root: Optional[FileNode] = None
+
+    def setRoot(self, root: Optional[FileNode]):
+        self.beginResetModel()
+        self._root = root
+        self.endResetModel()
+
+    def node_from_index(self, index: QModelIndex) -> Optional[FileNode]:
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        node = self.node_from_index(parent)
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        node = self.node_from_index(parent)
+        return len(node.children) if node is not None else 0
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        # 视图为每个可见行查询是否显示展开箭头，只看节点本身即可，不必创建子项
+        if parent.column() > 0:
+            return False
+        node = self.node_from_index(parent)
+        return node is not None and bool(node.children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(FILE_TREE_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                if node.type is NodeType.DIRECTORY:
+                    return f"📁 {node.name} ({len(node.children)})"
+                return f"📄 {node.name}"
+            if column == 1:
+                return format_bytes(node.size)
+        elif role == Qt.ItemDataRole.UserRole:
+            if column == 0:
+                return node
+            if column == 2:
+                return node.fileData
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return FILE_TREE_HEADERS[section]
+        return None
+
+class SearchResultModel(QAbstractTableModel):
+    """搜索结果的扁平列表，每行为 (路径, 文件节点)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = []
+        self._overflow_message = None
+
+    def setResults(self, results: list, overflow_message: Optional[str] = None):
+        self.beginResetModel()
+        self._results = results
+        self._overflow_message = overflow_message
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._results) + (1 if self._overflow_message else 0)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(FILE_TREE_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+
+        if row >= len(self._results):
+            if role == Qt.ItemDataRole.DisplayRole and column == 0:
+                return self._overflow_message
+            return None
+
+        path, node = self._results[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return path
+            if column == 1:
+                return format_bytes(node.size)
+        elif role == Qt.ItemDataRole.UserRole:
+            if column == 0:
+                return node
+            if column == 2:
+                return node.fileData
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return FILE_TREE_HEADERS[section]
+        return None
 
 class FileBrowserTab(QWidget):
 
@@ -644,8 +1157,16 @@ class FileBrowserTab(QWidget):
         self.current_version = ""
         self.available_voices = []
         self.worker = None
-        self.load_timer = None
-        self.file_cache = {}
+        # 上次加载失败时置位，再次请求相同的游戏和版本时重新加载而不是跳过
+        self._load_failed = False
+        # 已取消但线程尚未退出的任务，退出后再释放，取消时不阻塞界面
+        self._retired_workers = []
+        # 连续切换时只重启同一个定时器，停顿后才真正加载
+        self.load_timer = QTimer(self)
+        self.load_timer.setSingleShot(True)
+        self.load_timer.timeout.connect(self.refresh_file_list)
+        # 每棵文件树可能占用上百 MB，只保留最近使用的几棵
+        self.file_cache = OrderedDict()
 
         self.init_ui()
 
@@ -658,6 +1179,11 @@ class FileBrowserTab(QWidget):
         self.search_input.setPlaceholderText("搜索文件名...")
         self.search_input.textChanged.connect(self.on_search)
         toolbar.addWidget(QLabel("搜索:"))
+
+        # 输入停顿后再刷新结果，避免每输入一个字符就重建一次树
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(lambda: self.populate_tree(self.search_input.text()))
         toolbar.addWidget(self.search_input)
 
         self.voice_combo = QComboBox()
@@ -670,6 +1196,14 @@ class FileBrowserTab(QWidget):
         self.refresh_btn.clicked.connect(self.refresh_file_list)
         toolbar.addWidget(self.refresh_btn)
 
+        self.expand_all_btn = PushButton("展开全部")
+        self.expand_all_btn.clicked.connect(self.expand_all)
+        toolbar.addWidget(self.expand_all_btn)
+
+        self.collapse_all_btn = PushButton("全部折叠")
+        self.collapse_all_btn.clicked.connect(self.collapse_all)
+        toolbar.addWidget(self.collapse_all_btn)
+
         toolbar.addStretch()
         layout.addLayout(toolbar)
 
@@ -677,20 +1211,20 @@ class FileBrowserTab(QWidget):
         self.stats_label.setStyleSheet("padding: 5px; background-color: #f0f0f0; border-radius: 3px;")
         layout.addWidget(self.stats_label)
 
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabels(["名称", "大小", "操作"])
-        self.tree_widget.setColumnWidth(0, 400)
-        self.tree_widget.setColumnWidth(1, 120)
-        self.tree_widget.itemExpanded.connect(self.on_item_expanded)
-        self.tree_widget.setUniformRowHeights(True)
-        self.tree_widget.setAnimated(False)
+        self.tree_model = FileNodeModel(self)
+        self.search_model = SearchResultModel(self)
 
-        header = self.tree_widget.header()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree_view = QTreeView()
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setAnimated(False)
+        self._set_view_model(self.tree_model)
+
+        # 操作列按钮由委托绘制，按需只处理可见行
+        self.file_action_delegate = FileActionDelegate(self.tree_view)
+        self.file_action_delegate.button_clicked.connect(self.on_file_action)
+        self.tree_view.setItemDelegateForColumn(2, self.file_action_delegate)
 
-        layout.addWidget(self.tree_widget)
+        layout.addWidget(self.tree_view)
 
         self.setLayout(layout)
 
@@ -701,6 +1235,7 @@ class FileBrowserTab(QWidget):
         self.current_game = game
         self.current_version = version
         self.decompressed_path = version_data.get('decompressed_path')
+        self.file_action_delegate.download_enabled = bool(self.decompressed_path)
         self.available_voices = available_voices
 
         # 只在语音包列表变化时重建 combo
@@ -718,42 +1253,38 @@ class FileBrowserTab(QWidget):
                 self.voice_combo.setCurrentIndex(current_selection)
             self.voice_combo.blockSignals(False)
 
-        if is_same and not voices_changed:
-            print(f"[INFO] 相同的游戏和版本，跳过加载")
+        if is_same and not voices_changed and not self._load_failed:
+            info("相同的游戏和版本，跳过加载")
             return
 
-        if self.load_timer:
-            self.load_timer.stop()
-            self.load_timer.deleteLater()
-            self.load_timer = None
-
-        self.load_timer = QTimer(self)
-        self.load_timer.setSingleShot(True)
-        self.load_timer.timeout.connect(self.refresh_file_list)
         self.load_timer.start(300)
 
     def refresh_file_list(self):
         if not self.current_game or not self.current_version:
             return
+        self._load_failed = False
 
         voice_packs = self.voice_combo.currentData() or []
         voice_packs_tuple = tuple(sorted(voice_packs))
         cache_key = (self.current_game, self.current_version, voice_packs_tuple)
 
         if cache_key in self.file_cache:
-            print(f"[INFO] 从缓存加载文件列表: {cache_key}")
+            info(f"从缓存加载文件列表: {cache_key}")
+            self.file_cache.move_to_end(cache_key)
             self.on_file_list_loaded(self.file_cache[cache_key])
             return
 
         if self.worker and self.worker.isRunning():
-            print("[INFO] 取消之前的文件加载任务")
-            self.worker.cancel()
-            self.worker.wait(2000)
-            self.worker.deleteLater()
-            self.worker = None
+            info("取消之前的文件加载任务")
+            self._retire_worker()
 
         self.stats_label.setText("正在加载文件列表...")
-        self.tree_widget.clear()
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            self.tree_model.setRoot(None)
+            self._set_view_model(self.tree_model)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
 
         self.worker = LoadFileListWorker(
             self.api_client,
@@ -763,20 +1294,45 @@ class FileBrowserTab(QWidget):
             self.decompressed_path,
             self
         )
-        self.worker.finished.connect(lambda data: self.on_file_list_loaded(data, cache_key))
+        self.worker.finished.connect(functools.partial(self.on_file_list_loaded, cache_key=cache_key))
         self.worker.error.connect(self.on_load_error)
         self.worker.progress.connect(self.on_progress)
         self.worker.start()
 
+    def _retire_worker(self):
+        """取消当前任务但不等待线程退出；已取消的任务不会再发出信号"""
+        self.worker.cancel()
+        still_running = [self.worker]
+        for worker in self._retired_workers:
+            if worker.isRunning():
+                still_running.append(worker)
+            else:
+                worker.deleteLater()
+        self._retired_workers = still_running
+        self.worker = None
+
+    def stop_loading(self) -> list:
+        """停止待触发的加载并取消当前任务，返回仍在运行的线程"""
+        self.load_timer.stop()
+        self._search_timer.stop()
+        if self.worker:
+            self._retire_worker()
+        return [worker for worker in self._retired_workers if worker.isRunning()]
+
     def on_progress(self, message: str):
         self.stats_label.setText(message)
 
     def on_file_list_loaded(self, data: dict, cache_key=None):
-        print(f"[INFO] 文件列表加载完成，共 {data['count']} 个文件")
+        info(f"文件列表加载完成，共 {data['count']} 个文件")
+        self._load_failed = False
 
         if cache_key:
             self.file_cache[cache_key] = data
-            print(f"[INFO] 缓存文件列表: {cache_key}")
+            self.file_cache.move_to_end(cache_key)
+            while len(self.file_cache) > FILE_CACHE_SIZE:
+                evicted_key, _ = self.file_cache.popitem(last=False)
+                info(f"移除最久未使用的文件列表缓存: {evicted_key}")
+            info(f"缓存文件列表: {cache_key}")
 
         self.file_tree = data['tree']
         self.stats_label.setText(
@@ -785,148 +1341,134 @@ class FileBrowserTab(QWidget):
 
         self.populate_tree()
 
-    def on_load_error(self, error: str):
-        print(f"[ERROR] 文件列表加载失败: {error}")
-        self.stats_label.setText(f"加载失败: {error}")
+    def clear_cache(self):
+        """清空已缓存的文件树"""
+        self.file_cache.clear()
+
+    def on_load_error(self, err: str):
+        error(f"文件列表加载失败: {err}")
+        self._load_failed = True
+        self.stats_label.setText(f"加载失败: {err}")
 
     def on_voice_changed(self, index: int):
         pass
 
     def on_search(self, text: str):
-        self.populate_tree(text)
+        self._search_timer.start(200)
+
+    def _set_view_model(self, model: QAbstractItemModel):
+        """切换视图使用的模型；更换模型后表头会重建，需要重新设置列宽"""
+        if self.tree_view.model() is model:
+            return
+        # setModel 会新建选择模型，旧的不会自动释放，否则每次切换模型都会残留一个
+        old_selection = self.tree_view.selectionModel()
+        self.tree_view.setModel(model)
+        if old_selection is not None:
+            old_selection.deleteLater()
+        # 表头 setModel 时也会自建一个选择模型，随后被替换为视图的选择模型，同样需要释放
+        header = self.tree_view.header()
+        for selection in header.findChildren(QItemSelectionModel, options=Qt.FindChildOption.FindDirectChildrenOnly):
+            if selection is not header.selectionModel():
+                selection.deleteLater()
+        self.tree_view.setColumnWidth(0, 400)
+        self.tree_view.setColumnWidth(1, 120)
+
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
 
     def populate_tree(self, search_text: str = ""):
-        import time
         start_time = time.time()
 
-        self.tree_widget.clear()
+        # 清空也放在禁用更新的区间内，避免先重绘一次空视图
+        self.tree_view.setUpdatesEnabled(False)
 
-        if not self.file_tree:
-            return
+        try:
+            self.tree_model.setRoot(None)
+            self.search_model.setResults([])
 
-        self.tree_widget.setUpdatesEnabled(False)
-        self.tree_widget.setSortingEnabled(False)
+            if not self.file_tree:
+                return
 
-        try:
             if search_text:
-                results = self.search_files(self.file_tree, search_text.lower())
                 max_results = 500
+                # 多取一个结果即可判断是否超出上限，无需遍历整棵树
+                results = self.search_files(self.file_tree, search_text.lower(), max_results + 1)
 
-                items = []
-                for i, (path, node) in enumerate(results):
-                    if i >= max_results:
-                        item = QTreeWidgetItem()
-                        item.setText(0, f"... 还有 {len(results) - max_results} 个结果未显示")
-                        items.append(item)
-                        break
-                    item = self.create_search_result_item(path, node)
-                    items.append(item)
+                overflow_message = None
+                if len(results) > max_results:
+                    results = results[:max_results]
+                    overflow_message = f"... 结果超过 {max_results} 个，请输入更精确的关键词"
 
-                self.tree_widget.addTopLevelItems(items)
+                self.search_model.setResults(results, overflow_message)
+                self._set_view_model(self.search_model)
             else:
-                items = []
-                for child in self.file_tree.children:
-                    item = self.create_tree_item(child, "", lazy=True)
-                    items.append(item)
-
-                self.tree_widget.addTopLevelItems(items)
+                self.tree_model.setRoot(self.file_tree)
+                self._set_view_model(self.tree_model)
         finally:
-            self.tree_widget.setSortingEnabled(True)
-            self.tree_widget.setUpdatesEnabled(True)
+            self.tree_view.setUpdatesEnabled(True)
 
             elapsed = time.time() - start_time
             debug(f"UI 渲染耗时: {elapsed:.2f}秒")
 
-    def search_files(self, node: FileNode, keyword: str, path: str = "") -> list:
-        results = []
-        current_path = f"{path}/{node.name}" if path else node.name
-
-        if node.type == NodeType.FILE:
-            if keyword in node.name.lower() or keyword in current_path.lower():
-                results.append((current_path, node))
-        else:
-            for child in node.children:
-                results.extend(self.search_files(child, keyword, current_path))
-
-        return results
-
-    def create_search_result_item(self, path: str, node: FileNode) -> QTreeWidgetItem:
-        item = QTreeWidgetItem()
-        item.setText(0, f"{path}")
-        item.setText(1, format_bytes(node.size))
-
-        if node.type == NodeType.FILE and node.fileData:
-            item.setData(2, Qt.ItemDataRole.UserRole, node.fileData)
-
-        return item
-
-    def create_tree_item(self, node: FileNode, path: str, lazy: bool = False) -> QTreeWidgetItem:
-        item = QTreeWidgetItem()
-
-        if node.type == NodeType.DIRECTORY:
-            item.setText(0, f"📁 {node.name} ({len(node.children)})")
-            item.setData(0, Qt.ItemDataRole.UserRole, (node, path))
-        else:
-            item.setText(0, f"📄 {node.name}")
-
-        item.setText(1, format_bytes(node.size))
+    def expand_all(self):
+        """递归展开选中的目录（未选中目录时展开整棵树），整个过程只重绘一次"""
+        index = self.tree_view.currentIndex().siblingAtColumn(0)
+        node = index.data(Qt.ItemDataRole.UserRole) if index.isValid() else None
+        if node is None or node.type is not NodeType.DIRECTORY:
+            index = self.tree_view.rootIndex()
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            self.tree_view.expandRecursively(index, -1)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
 
-        if node.type == NodeType.FILE and node.fileData:
-            item.setData(2, Qt.ItemDataRole.UserRole, node.fileData)
+    def collapse_all(self):
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            self.tree_view.collapseAll()
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
 
-        if node.type == NodeType.DIRECTORY:
-            if lazy and len(node.children) > 0:
-                placeholder = QTreeWidgetItem()
-                placeholder.setText(0, "加载中...")
-                item.addChild(placeholder)
-                item.setExpanded(False)
+    def search_files(self, node: FileNode, keyword: str, limit: Optional[int] = None) -> list:
+        """按树的顺序查找匹配的文件，找到 limit 个结果后立即停止；
+        小写路径随遍历逐级拼接，每个节点只调用一次 lower()"""
+        _FILE = NodeType.FILE
+        results = []
+        stack = [(node, "", "")]
+        while stack:
+            current, path, path_lower = stack.pop()
+            name_lower = current.name.lower()
+            if path:
+                current_path = f"{path}/{current.name}"
+                current_lower = f"{path_lower}/{name_lower}"
             else:
-                for child in node.children:
-                    child_item = self.create_tree_item(child, f"{path}/{node.name}" if path else node.name, lazy=False)
-                    item.addChild(child_item)
-
-        return item
-
-    def add_file_buttons(self, item: QTreeWidgetItem, file_data: PkgVersionFile):
-        btn_widget = QWidget()
-        btn_layout = QHBoxLayout(btn_widget)
-        btn_layout.setContentsMargins(2, 2, 2, 2)
-
-        if self.decompressed_path:
-            download_btn = QPushButton("下载")
-            url = f"{self.decompressed_path}/{file_data.remoteName}"
-            download_btn.clicked.connect(lambda: open_link(url))
-            btn_layout.addWidget(download_btn)
-
-        if file_data.md5:
-            md5_btn = QPushButton("MD5")
-            md5_btn.clicked.connect(lambda: self.copy_hash(file_data.md5, "MD5"))
-            btn_layout.addWidget(md5_btn)
+                current_path = current.name
+                current_lower = name_lower
+
+            if current.type is _FILE:
+                # 路径包含文件名，只需检查一次路径
+                if keyword in current_lower:
+                    results.append((current_path, current))
+                    if limit is not None and len(results) >= limit:
+                        break
+            else:
+                stack.extend((child, current_path, current_lower) for child in reversed(current.children))
 
-        if file_data.hash:
-            hash_btn = QPushButton("Hash")
-            hash_btn.clicked.connect(lambda: self.copy_hash(file_data.hash, "Hash"))
-            btn_layout.addWidget(hash_btn)
+        return results
 
-        self.tree_widget.setItemWidget(item, 2, btn_widget)
+    def on_file_action(self, action: str, file_data: PkgVersionFile):
+        if action == "download":
+            open_link(f"{self.decompressed_path}/{file_data.remoteName}")
+        elif action == "md5":
+            self.copy_hash(file_data.md5, "MD5")
+        elif action == "hash":
+            self.copy_hash(file_data.hash, "Hash")
 
     def copy_hash(self, hash_value: str, hash_type: str):
         copy_to_clipboard(hash_value)
         show_message(self, "成功", f"{hash_type} 已复制到剪贴板", "success")
 
-    def on_item_expanded(self, item: QTreeWidgetItem):
-        if item.childCount() == 1:
-            first_child = item.child(0)
-            if first_child.text(0) == "加载中...":
-                item.removeChild(first_child)
-
-                data = item.data(0, Qt.ItemDataRole.UserRole)
-                if data:
-                    node, path = data
-                    for child in node.children:
-                        child_item = self.create_tree_item(child, f"{path}/{node.name}" if path else node.name, lazy=True)
-                        item.addChild(child_item)
-
 class LoadVersionWorker(QThread):
     finished = Signal(dict)
     error = Signal(str)
@@ -941,15 +1483,61 @@ class LoadVersionWorker(QThread):
         self._is_cancelled = True
 
     def run(self):
+        if self._is_cancelled:
+            return
+        # 请求在守护线程中进行，线程本身只轮询结果，取消后可立即退出
+        future = submit_daemon(threading.Semaphore(1), self.api_client.fetch_version_list, self.game)
         try:
-            if self._is_cancelled:
-                return
-            data = self.api_client.fetch_version_list(self.game)
-            if not self._is_cancelled:
-                self.finished.emit(data)
+            for done in iter_completed([future], lambda: self._is_cancelled):
+                data = done.result()
+                if not self._is_cancelled:
+                    self.finished.emit(data)
         except Exception as e:
             if not self._is_cancelled:
                 self.error.emit(str(e))
+        finally:
+            future.cancel()
+
+class PreloadVersionsWorker(QThread):
+    """在同一个线程中并发请求多个游戏的版本列表，所有请求共享 APIClient 的连接池"""
+    game_loaded = Signal(dict, str)
+    game_failed = Signal(str, str)
+
+    def __init__(self, api_client: APIClient, games: list, parent=None):
+        super().__init__(parent)
+        self.api_client = api_client
+        self.games = games
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    def run(self):
+        if self._is_cancelled or not self.games:
+            return
+
+        limiter = threading.Semaphore(PRELOAD_MAX_WORKERS)
+        futures = {
+            submit_daemon(limiter, self.api_client.fetch_version_list, game): game
+            for game in self.games
+        }
+        try:
+            for future in iter_completed(futures, lambda: self._is_cancelled):
+                if self._is_cancelled:
+                    return
+
+                game = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    if not self._is_cancelled:
+                        self.game_failed.emit(str(e), game)
+                    continue
+                if not self._is_cancelled:
+                    self.game_loaded.emit(data, game)
+        finally:
+            for future in futures:
+                future.cancel()
 
 class MainWindow(FluentWindow):
 
@@ -961,11 +1549,36 @@ class MainWindow(FluentWindow):
         self.current_version = ""
         self.version_data = {}
         self.version_list_data = {}
-        self.version_worker = None
-        self.load_timer = None
+        # 仍在运行的版本列表请求，完成后移除；切换游戏时不取消，结果会写入缓存
+        self._version_workers = set()
+        # 窗口关闭后置位，之后到达的回调不再更新界面
+        self._is_shutting_down = False
+        # 程序内部选中版本时置位，避免 version_selected 信号再次触发加载
+        self._suppress_version_signal = False
+        # 快速切换游戏时只重启同一个定时器，停顿后加载最后选中的游戏
+        self._pending_game = None
+        self.load_timer = QTimer(self)
+        self.load_timer.setSingleShot(True)
+        self.load_timer.timeout.connect(lambda: self._do_load_game_versions(self._pending_game))
+        # 预加载进度提示合并显示，每 150ms 最多弹出一次
+        self._latest_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(150)
+        self._status_timer.timeout.connect(self._flush_status)
+        # 正在请求中的游戏 -> [(成功回调, 失败回调)]，重复请求只追加回调
+        self._inflight: Dict[str, List[tuple]] = {}
 
         self.version_cache = {}
-        self.preload_workers = []
+        self.preload_worker = None
+
+        # 测试模式下不读写磁盘缓存
+        self.cache_store = None
+        if not test_mode:
+            self.cache_store = CacheStore()
+            self.cache_store.load()
+            self.api_client.cache_store = self.cache_store
+            self.version_cache.update(self.cache_store.fresh_data())
         self.is_initial_loading = True
         self.preload_total = 0
         self.preload_completed = 0
@@ -977,6 +1590,8 @@ class MainWindow(FluentWindow):
         self.init_ui()
 
         if not test_mode:
+            # 首个版本列表请求要等防抖定时器到期，趁这段时间在后台完成 DNS/TCP/TLS 握手
+            threading.Thread(target=self.api_client.warm, daemon=True).start()
             self.load_game_versions(self.current_game)
             QTimer.singleShot(1000, self.preload_all_games)
 
@@ -1038,52 +1653,76 @@ class MainWindow(FluentWindow):
         self.package_tab.setEnabled(False)
 
         if not self.test_mode:
-            QTimer.singleShot(100, lambda: self.show_info("正在初始化", "正在加载游戏数据..."))
+            QTimer.singleShot(100, functools.partial(self.show_info, "正在初始化", "正在加载游戏数据..."))
 
     def load_game_versions(self, game: str):
-        if self.load_timer:
-            self.load_timer.stop()
-            self.load_timer.deleteLater()
-            self.load_timer = None
-
-        if self.version_worker is not None and self.version_worker.isRunning():
-            debug("取消之前的加载任务")
-            self.version_worker.cancel()
-            self.version_worker.wait(2000)
-            self.version_worker.deleteLater()
-            self.version_worker = None
-
-        self.load_timer = QTimer(self)
-        self.load_timer.setSingleShot(True)
-        self.load_timer.timeout.connect(lambda: self._do_load_game_versions(game))
+        self._pending_game = game
         self.load_timer.start(300)
 
         self.version_list.set_loading(True)
 
     def _do_load_game_versions(self, game: str):
         if game in self.version_cache:
-            print(f"[INFO] 从缓存加载游戏版本列表: {game}")
+            info(f"从缓存加载游戏版本列表: {game}")
             self.on_versions_loaded(self.version_cache[game], game, from_cache=True)
             return
 
-        print(f"[INFO] 开始加载游戏版本列表: {game}")
-        self.version_worker = LoadVersionWorker(self.api_client, game, self)
-        self.version_worker.finished.connect(lambda data: self.on_versions_loaded(data, game))
-        self.version_worker.error.connect(self.on_load_error)
-        self.version_worker.start()
+        if self._track_inflight(game,
+                                functools.partial(self.on_versions_loaded, game=game),
+                                functools.partial(self.on_load_error, game=game)):
+            info(f"游戏版本列表已在加载中，等待结果: {game}")
+            return
+
+        info(f"开始加载游戏版本列表: {game}")
+        worker = LoadVersionWorker(self.api_client, game, self)
+        worker.finished.connect(functools.partial(self._on_inflight_loaded, game=game))
+        worker.error.connect(functools.partial(self._on_inflight_failed, game=game))
+        worker.finished.connect(functools.partial(self._release_version_worker, worker))
+        worker.error.connect(functools.partial(self._release_version_worker, worker))
+        self._version_workers.add(worker)
+        worker.start()
+
+    def _release_version_worker(self, worker: LoadVersionWorker, *_):
+        """请求结束后移除并释放线程；信号发出后 run() 随即返回，等待时间可以忽略"""
+        self._version_workers.discard(worker)
+        worker.wait()
+        worker.deleteLater()
+
+    def _track_inflight(self, game: str, on_done, on_error) -> bool:
+        """登记请求完成后的回调；该游戏已有请求在进行中时返回 True，调用方无需再发起请求"""
+        callbacks = self._inflight.get(game)
+        if callbacks is not None:
+            callbacks.append((on_done, on_error))
+            return True
+        self._inflight[game] = [(on_done, on_error)]
+        return False
+
+    def _on_inflight_loaded(self, data: dict, game: str):
+        for on_done, _ in self._inflight.pop(game, []):
+            on_done(data)
+
+    def _on_inflight_failed(self, err: str, game: str):
+        for _, on_error in self._inflight.pop(game, []):
+            on_error(err)
 
     def on_versions_loaded(self, data: dict, game: str = None, from_cache: bool = False):
+        if self._is_shutting_down:
+            return
         if from_cache:
-            print(f"[INFO] 从缓存加载版本列表成功，共 {len(data)} 个版本")
+            info(f"从缓存加载版本列表成功，共 {len(data)} 个版本")
         else:
-            print(f"[INFO] 版本列表加载成功，共 {len(data)} 个版本")
+            info(f"版本列表加载成功，共 {len(data)} 个版本")
 
         if game and not from_cache:
             self.version_cache[game] = data
+            self.save_version_cache()
+
+        # 请求期间用户已切换到其他游戏，只保留缓存，不更新界面
+        if game and game != self.current_game:
+            return
 
         self.version_list_data = data
-        versions = list(data.keys())
-        versions.reverse()
+        versions = list(reversed(data))
         self.version_list.set_versions(versions)
         
         if not self.is_initial_loading:
@@ -1095,21 +1734,29 @@ class MainWindow(FluentWindow):
         if versions:
             self.current_version = versions[0]
             debug(f"当前版本: {self.current_version}")
-            self.version_list.select_version(self.current_version)
-            # load_version_data() 会通过 version_selected 信号自动调用，无需手动调用
+            self._suppress_version_signal = True
+            try:
+                self.version_list.select_version(self.current_version)
+            finally:
+                self._suppress_version_signal = False
+            # 选中信号已被屏蔽，这里只加载一次
+            self.load_version_data()
 
             if game == self.current_game and not from_cache and not self.test_mode and not self.is_initial_loading:
                 self.show_success("加载完成", f"已加载 {len(versions)} 个版本")
 
-    def on_load_error(self, error: str):
-        error(f"加载失败: {error}")
+    def on_load_error(self, err: str, game: str = None):
+        error(f"加载失败: {err}")
+        # 请求期间用户已切换到其他游戏，不影响当前游戏的加载状态
+        if game and game != self.current_game:
+            return
         if not self.is_initial_loading:
             self.version_list.set_loading(False)
             self.game_selector.setEnabled(True)
             self.version_list.setEnabled(True)
             self.package_tab.setEnabled(True)
         if not self.test_mode:
-            self.show_error("加载失败", error)
+            self.show_error("加载失败", err)
 
     def _show_bar(self, bar_type: str, title: str, content: str, duration: int = 3000):
         """显示 InfoBar 通知"""
@@ -1137,20 +1784,26 @@ class MainWindow(FluentWindow):
 
     def preload_all_games(self):
         debug("开始预加载所有游戏版本列表...")
-        self.preload_total = 0
+        games = [game_key for game_key in GAME_CONFIG if game_key not in self.version_cache]
+        self.preload_total = len(games)
         self.preload_completed = 0
 
-        for game_key in GAME_CONFIG.keys():
-            if game_key in self.version_cache:
-                continue
+        # 已在请求中的游戏只登记回调，等待现有请求完成
+        to_fetch = [
+            game for game in games
+            if not self._track_inflight(
+                game,
+                functools.partial(self.on_preload_finished, game=game),
+                functools.partial(self.on_preload_error, game=game)
+            )
+        ]
 
-            self.preload_total += 1
-            debug(f"预加载游戏: {game_key}")
-            worker = LoadVersionWorker(self.api_client, game_key, self)
-            worker.finished.connect(lambda data, g=game_key: self.on_preload_finished(data, g))
-            worker.error.connect(lambda err, g=game_key: self.on_preload_error(err, g))
-            self.preload_workers.append(worker)
-            worker.start()
+        if to_fetch:
+            debug(f"预加载游戏: {', '.join(to_fetch)}")
+            self.preload_worker = PreloadVersionsWorker(self.api_client, to_fetch, self)
+            self.preload_worker.game_loaded.connect(self._on_inflight_loaded)
+            self.preload_worker.game_failed.connect(self._on_inflight_failed)
+            self.preload_worker.start()
 
         if self.preload_total > 0 and not self.test_mode:
             self.show_info("预加载中", f"正在预加载其他游戏数据... (0/{self.preload_total})")
@@ -1159,43 +1812,113 @@ class MainWindow(FluentWindow):
             self.enable_ui_after_preload()
 
     def on_preload_finished(self, data: dict, game: str):
-        print(f"[INFO] 预加载完成: {game}, 共 {len(data)} 个版本")
+        if self._is_shutting_down:
+            return
+        info(f"预加载完成: {game}, 共 {len(data)} 个版本")
         self.version_cache[game] = data
+        self.save_version_cache()
         self.preload_completed += 1
 
-        game_name = GAME_CONFIG.get(game, {}).get('name', game)
+        game_name = GAME_NAMES.get(game, game)
 
         if self.preload_completed >= self.preload_total:
-            print("[INFO] 所有游戏版本列表预加载完成")
+            info("所有游戏版本列表预加载完成")
+            self._cancel_status()
             self.enable_ui_after_preload()
             if not self.test_mode:
                 self.show_success("初始化完成", "所有游戏数据已加载")
         else:
-            if not self.test_mode:
-                self.show_info(f"正在预加载: {game_name}", f"进度: {self.preload_completed}/{self.preload_total}")
+            self._post_status('info', f"正在预加载: {game_name}", f"进度: {self.preload_completed}/{self.preload_total}")
 
     def on_preload_error(self, err: str, game: str):
+        if self._is_shutting_down:
+            return
         error(f"预加载 {game} 失败: {err}")
         self.preload_completed += 1
 
-        game_name = GAME_CONFIG.get(game, {}).get('name', game)
+        game_name = GAME_NAMES.get(game, game)
 
         if self.preload_completed >= self.preload_total:
+            self._cancel_status()
             self.enable_ui_after_preload()
             if not self.test_mode:
                 self.show_warning("初始化完成", "部分游戏加载失败")
         else:
-            if not self.test_mode:
-                self.show_warning(f"预加载失败: {game_name}", f"进度: {self.preload_completed}/{self.preload_total}")
+            self._post_status('warning', f"预加载失败: {game_name}", f"进度: {self.preload_completed}/{self.preload_total}")
+
+    def _post_status(self, bar_type: str, title: str, content: str):
+        """记录最新的进度提示，定时器到期时只显示最后一条"""
+        if self.test_mode:
+            return
+        self._latest_status = (bar_type, title, content)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        if self._latest_status:
+            self._show_bar(*self._latest_status)
+            self._latest_status = None
+
+    def _cancel_status(self):
+        self._status_timer.stop()
+        self._latest_status = None
+
+    def save_version_cache(self):
+        """在线程池中写入磁盘缓存，不阻塞界面"""
+        if self.cache_store:
+            QThreadPool.globalInstance().start(self.cache_store.save)
+
+    def shutdown(self):
+        """同时取消所有后台任务，再在同一个时限内等待它们结束"""
+        if self._is_shutting_down:
+            return
+        self._is_shutting_down = True
+        self.load_timer.stop()
+        self._cancel_status()
+
+        workers = self.file_browser_tab.stop_loading()
+        for worker in (*self._version_workers, self.preload_worker):
+            if worker and worker.isRunning():
+                worker.cancel()
+                workers.append(worker)
+
+        deadline = QDeadlineTimer(SHUTDOWN_TIMEOUT_MS)
+        for worker in workers:
+            worker.wait(deadline)
+
+    def closeEvent(self, event):
+        self.shutdown()
+        super().closeEvent(event)
 
     def enable_ui_after_preload(self):
         """预加载完成后启用UI"""
-        print("[INFO] 启用UI交互")
+        info("启用UI交互")
         self.is_initial_loading = False
         self.version_list.set_loading(False)
         self.game_selector.setEnabled(True)
         self.version_list.setEnabled(True)
         self.package_tab.setEnabled(True)
+        self.prefetch_file_tree()
+
+    def prefetch_file_tree(self):
+        """网络空闲后在后台提前加载当前版本的文件树，首次打开文件浏览器时无需等待"""
+        if self.test_mode or self.is_file_browser_active():
+            return
+        if not self.current_version or self.current_version not in self.version_list_data:
+            return
+        info(f"后台预取文件树: {GAME_NAMES[self.current_game]} {self.current_version}")
+        # 不清除 file_browser_needs_refresh：打开文件浏览器时再调用一次 load_data，
+        # 预取成功或仍在进行时会被跳过，失败时则重新加载
+        self.load_file_browser()
+
+    def load_file_browser(self):
+        """把当前游戏和版本交给文件浏览器加载，相同的数据会被直接跳过"""
+        self.file_browser_tab.load_data(
+            self.current_game,
+            self.current_version,
+            self.version_list_data[self.current_version],
+            GAME_VOICES[self.current_game]
+        )
 
     def on_game_selected(self, game: str):
         if game != self.current_game:
@@ -1203,6 +1926,8 @@ class MainWindow(FluentWindow):
             self.load_game_versions(game)
 
     def on_version_selected(self, version: str):
+        if self._suppress_version_signal:
+            return
         if version and version != self.current_version:
             self.current_version = version
             self.load_version_data()
@@ -1212,27 +1937,27 @@ class MainWindow(FluentWindow):
             return
 
         version_data = self.version_list_data[self.current_version]
-        game_config = GAME_CONFIG[self.current_game]
 
         self.setWindowTitle(
-            f"{game_config['name']} {self.current_version} - HoyoFiles"
+            f"{GAME_NAMES[self.current_game]} {self.current_version} - HoyoFiles"
         )
 
         # 加载游戏包数据（主页需要）
-        QTimer.singleShot(0, lambda: self.package_tab.load_data(version_data))
+        QTimer.singleShot(0, functools.partial(self.package_tab.load_data, version_data))
 
         # 只在文件浏览器标签当前激活时才加载文件树
         if self.is_file_browser_active():
-            QTimer.singleShot(50, lambda: self.file_browser_tab.load_data(
+            QTimer.singleShot(50, functools.partial(
+                self.file_browser_tab.load_data,
                 self.current_game,
                 self.current_version,
                 version_data,
-                game_config['voice']
+                GAME_VOICES[self.current_game]
             ))
         else:
             # 标记需要刷新，等用户切换到文件浏览器时再加载
             self.file_browser_needs_refresh = True
-            print("[INFO] 文件浏览器未激活，延迟加载文件树")
+            info("文件浏览器未激活，延迟加载文件树")
     
     def is_file_browser_active(self):
         """检查文件浏览器标签是否当前激活"""
@@ -1246,22 +1971,14 @@ class MainWindow(FluentWindow):
         # 检查是否切换到文件浏览器
         if current_widget == self.file_browser_tab:
             if not self.file_browser_visited:
-                print("[INFO] 首次访问文件浏览器")
+                info("首次访问文件浏览器")
                 self.file_browser_visited = True
             
             # 如果有待加载的数据，立即加载
             if self.file_browser_needs_refresh and self.current_version:
-                print(f"[INFO] 加载文件树: {GAME_CONFIG[self.current_game]['name']} {self.current_version}")
+                info(f"加载文件树: {GAME_NAMES[self.current_game]} {self.current_version}")
                 self.file_browser_needs_refresh = False
-                version_data = self.version_list_data[self.current_version]
-                game_config = GAME_CONFIG[self.current_game]
-                
-                self.file_browser_tab.load_data(
-                    self.current_game,
-                    self.current_version,
-                    version_data,
-                    game_config['voice']
-                )
+                self.load_file_browser()
 
 def main():
     try:
@@ -1285,13 +2002,7 @@ def main():
             info(f"演示模式：将在 {demo_duration}ms 后自动关闭")
             def cleanup_and_quit():
                 debug("演示模式结束，正在关闭...")
-                if hasattr(window, 'version_worker') and window.version_worker:
-                    window.version_worker.cancel()
-                    window.version_worker.wait(1000)
-                for worker in window.preload_workers:
-                    if worker.isRunning():
-                        worker.cancel()
-                        worker.wait(1000)
+                # closeEvent 中会取消并等待所有后台任务
                 window.close()
                 app.quit()
 